@@ -1,4 +1,3 @@
-import copy
 import sys
 import warnings
 from dataclasses import dataclass, field
@@ -30,8 +29,7 @@ if sys.version_info >= (3, 12, 0):  # pragma: no cover
     default_handlers['queue_handler'].update({
         'class': 'modern_pylogging.logging_handlers.QueueHandlerContextVarsHappyPy312',
         'queue': {
-            '()': 'queue.Queue',
-            'maxsize': -1,
+            '()': 'queue.SimpleQueue',
         },
         'listener': 'modern_pylogging.logging_handlers.LoggingQueueListener',
         'handlers': ['console'],
@@ -55,17 +53,21 @@ default_picologging_handlers: dict[str, dict[str, Any]] = {
 }
 
 
+default_formatters: dict[str, dict[str, Any]] = {
+    'standard': {
+        '()': 'modern_pylogging.console_formatter.ConsoleFormatterLogging',
+        'format': '%(asctime)s | %(levelname)s | %(name)s:%(module)s:%(lineno)s | %(message)s | %(extra_data_str)s',
+    },
+    'json_fmt': {
+        '()': 'modern_pylogging.json_formatter.JsonFormatterLogging',
+        'json_dumps_module': 'json',
+    },
+}
+
+
 def _get_default_formatters() -> dict[str, dict[str, Any]]:
-    return {
-        'standard': {
-            '()': 'modern_pylogging.console_formatter.ConsoleFormatterLogging',
-            'format': '%(asctime)s | %(levelname)s | %(name)s:%(module)s:%(lineno)s | %(message)s | %(extra_data_str)s',
-        },
-        'json_fmt': {
-            '()': 'modern_pylogging.json_formatter.JsonFormatterLogging',
-            'json_dumps_module': 'json',
-        },
-    }
+    # formatters are changed in place during configuration, so `default_formatters` must stay untouched
+    return {name: dict(formatter) for name, formatter in default_formatters.items()}
 
 
 def _get_default_logging_module() -> Literal['logging', 'picologging']:
@@ -168,10 +170,9 @@ class LoggingConfig:
             raise MissingDependencyError('picologging')
         if self.json_dumps_module == 'orjson' and import_checker.is_orjson_installed is False:
             raise MissingDependencyError('orjson')
-        if 'standard' not in self.formatters:
-            self.formatters['standard'] = _get_default_formatters()['standard']
-        if 'json_fmt' not in self.formatters:
-            self.formatters['json_fmt'] = _get_default_formatters()['json_fmt']
+        for formatter_name, default_formatter in default_formatters.items():
+            if formatter_name not in self.formatters:
+                self.formatters[formatter_name] = dict(default_formatter)
         if 'console' not in self.handlers:
             self.handlers['console'] = _get_default_handlers(self.logging_module)['console']
         if 'queue_handler' not in self.handlers:
@@ -202,7 +203,14 @@ class LoggingConfig:
 
     def replace_formatters(self, override_formatters: dict[str, str], source: dict[str, Any]) -> dict[str, Any]:
         if override_formatters:
-            source = copy.deepcopy(source)
+            # only dicts of overridden handlers are changed here, so copying them is enough
+            source = {
+                **source,
+                'handlers': {
+                    handler_name: dict(config) if handler_name in override_formatters else config
+                    for handler_name, config in source['handlers'].items()
+                },
+            }
             # If we simply change the `source` variable, then new parameters
             # will remain in the 'default_handlers' dictionary at the module level.
             # This is generally not an issue because configuring logging multiple times
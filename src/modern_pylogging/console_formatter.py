@@ -15,19 +15,19 @@ if TYPE_CHECKING:
 class ConsoleFormatterMixin:
     def format(self, record: 'LogRecord') -> str:
         extra_data = self._prepare_log_extra(record)
-        # Build key=value string
-        k_v_strings = (f'{k} = {v}' for k, v in extra_data.items())  # noqa: WPS111
-        extra_data_str = ', '.join(k_v_strings)
-        record.extra_data_str = f'{{{extra_data_str}}}' if extra_data_str else ''  # type:ignore[union-attr]
+        if extra_data:
+            # Build key=value string (str.join works faster with a list than with a generator)
+            extra_data_str = ', '.join([f'{k} = {v}' for k, v in extra_data.items()])  # noqa: WPS111
+            record.extra_data_str = f'{{{extra_data_str}}}'  # type:ignore[union-attr]
+        else:
+            record.extra_data_str = ''  # type:ignore[union-attr]
         return cast('str', super().format(record))  # type:ignore[misc]
 
     def _prepare_log_extra(self, record: 'LogRecord') -> dict[str, Any]:
         extra = get_log_extra()
         if extra:
             return extra
-        if hasattr(record, 'binded_ctx_extra'):
-            return cast('dict[str, Any]', record.binded_ctx_extra)
-        return {}
+        return cast('dict[str, Any]', getattr(record, 'binded_ctx_extra', None) or {})
 
 
 class ConsoleFormatterLogging(ConsoleFormatterMixin, logging.Formatter):
@@ -7,29 +7,33 @@ import copy
 from contextvars import ContextVar
 from typing import Any
 
-_log_extra_data: ContextVar[dict[str, Any]] = ContextVar('_log_extra_data')
+# default of the ContextVar when nothing was set, never leaves this module
+_not_set: dict[str, Any] = {}
+_log_extra_data: ContextVar[dict[str, Any]] = ContextVar('_log_extra_data', default=_not_set)
 
 
 def set_log_extra(log_extra: dict[str, Any]) -> None:
-    _log_extra_data.set(log_extra)
+    # The stored dict is shared by all the records logged until the next update (without copying),
+    # so it's copied once here and changing the passed dict later doesn't affect queued records.
+    _log_extra_data.set(dict(log_extra))
 
 
 def get_log_extra(should_copy: bool = False) -> dict[str, Any]:  # noqa: FBT001,FBT002
-    try:
-        extra = _log_extra_data.get()
-    except LookupError:
+    extra = _log_extra_data.get()
+    if extra is _not_set:
         # sometimes we log from background tasks, etc...
-        # so contextvar wouldn't be set before
-        # to avoid explicit checks I decided just to use try-except here
-        extra = {}
+        # so contextvar wouldn't be set before.
+        # A new dict is returned so the shared default can't be changed by the caller.
+        return {}
     if should_copy:
         return copy.deepcopy(extra)
     return extra
 
 
 def update_log_extra(updates: dict[str, Any]) -> None:
-    # Our _log_extra contextvar contains mutable nested object (dict)
+    # Our _log_extra contextvar contains mutable object (dict)
     # We need that any updates would propagate to child tasks,
-    # but not to the parents - because of that we use get with copying
-    current_extra = get_log_extra(should_copy=True)
-    set_log_extra(current_extra | updates)
+    # but not to the parents - because of that we never change the stored dict in place,
+    # `|` builds a new one and the parent's context keeps the old one.
+    # (so values must not be mutated in place as well, pass a new value with update_log_extra instead)
+    _log_extra_data.set(get_log_extra() | updates)
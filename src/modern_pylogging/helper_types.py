@@ -131,6 +131,16 @@ class Logger(Protocol):  # noqa: WPS214
             None
         """
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        """Is this logger enabled for level 'level'?
+
+        Args:
+            level: Log level as an integer
+
+        Returns:
+            True if a message of this level would be processed
+        """
+
 
 class ASGIVersions(TypedDict):
     spec_version: str
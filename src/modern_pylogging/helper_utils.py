@@ -11,14 +11,13 @@ def get_env(envs: list[str], default: T) -> str | T:
     :param envs: list of env variable names
     :param default: default value if all env variables is not set
     """
-    env_value = None
+    # not cached on purpose - environment can be changed at runtime (and it is in tests)
+    environ = os.environ
     for env in envs:
-        env_value = os.getenv(env, None)
+        env_value = environ.get(env)
         if env_value is not None:
-            break
-    if env_value is None:
-        return default
-    return env_value
+            return env_value
+    return default
 
 
 def get_logging_level() -> str | int:
@@ -52,10 +51,17 @@ def resolve_handlers(handlers: list[Any]) -> list[Any]:
 
     These three objects provide interfaces to get converted items using the __getitem__ methods.
 
-    So indexing the list performs the evaluation of the objects
+    So indexing the list performs the evaluation of the objects.
+    (`list(handlers)` does not work - it iterates a list subclass without calling __getitem__)
 
     Due to missing typing in 'typeshed' we cannot type this as ConvertingList for now.
+
+    The result is not cached: dictConfig creates new handler objects on every configuration,
+    and the list is resolved only once per queue handler, when it's created.
     :param handlers: An instance if 'ConvertingList'
     :return: A list of resolved handlers
     """
-    return list(handlers)
+    if type(handlers) is list:  # noqa: WPS516
+        # nothing to convert
+        return handlers
+    return [handlers[index] for index in range(len(handlers))]
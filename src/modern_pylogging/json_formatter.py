@@ -2,29 +2,34 @@ import datetime as dt
 import logging
 import socket
 from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from functools import lru_cache
 from pathlib import Path
 from traceback import format_tb
 from typing import TYPE_CHECKING, Any, Final, Literal, TypeAlias, cast
 
-from modern_pylogging import import_checker
+from modern_pylogging import import_checker, json_helper
 from modern_pylogging.config_api import _get_default_json_dumps_module
 from modern_pylogging.contextvars_helpers import get_log_extra
-from modern_pylogging.helper_utils import get_env
+from modern_pylogging.helper_utils import MissingDependencyError, get_env
 
 if import_checker.is_picologging_installed:
     import picologging
 
+if import_checker.is_orjson_installed:
+    from modern_pylogging import orjson_helper
+
 if TYPE_CHECKING:
     LogRecord: TypeAlias = logging.LogRecord | picologging.LogRecord  # type:ignore[possibly-undefined]
 
 
 # skip default LogRecord attributes
-RESERVED_ATTRS: Final[set[str]] = {  # noqa: WPS407
+RESERVED_ATTRS: Final[frozenset[str]] = frozenset((
     'args',
     'asctime',
     'created',
     'exc_info',
+    'exc_text',
     'filename',
     'funcName',
     'levelname',
@@ -44,33 +49,40 @@ RESERVED_ATTRS: Final[set[str]] = {  # noqa: WPS407
     'threadName',
     'taskName',
     'binded_ctx_extra',  # from QueueHandlerContextVarsHappyPy312
-}
+))
 
 
-def grab_record_extra_fields(record: 'LogRecord', reserved: set[str]) -> dict[str, Any]:
+def grab_record_extra_fields(record: 'LogRecord', reserved: AbstractSet[str]) -> dict[str, Any]:
     """Extracts extra attributes from LogRecord object."""
-    extra_fields = {}
-    for key, value in record.__dict__.items():  # noqa: WPS110
-        if key in reserved:
-            continue
-        # this allows to have numeric keys
-        if hasattr(key, 'startswith') and key.startswith('_'):
-            continue
-        extra_fields[key] = value
-    return extra_fields
+    # type check allows to have numeric keys
+    return {
+        key: value  # noqa: WPS110
+        for key, value in record.__dict__.items()  # noqa: WPS110
+        if key not in reserved and (not isinstance(key, str) or key[:1] != '_')  # type:ignore[redundant-expr]
+    }
 
 
 def provide_json_dumps_func(json_dumps_module: Literal['json', 'orjson']) -> Callable[[Any], str]:
+    # helper modules are imported once at module level,
+    # here we only pick the function from them (so it still can be patched in tests)
     if json_dumps_module == 'orjson':
-        from modern_pylogging.orjson_helper import json_dumps
+        if not import_checker.is_orjson_installed:
+            raise MissingDependencyError('orjson')
+        return orjson_helper.json_dumps
+    return json_helper.json_dumps
 
-        return json_dumps
-    from modern_pylogging.json_helper import json_dumps
 
-    return json_dumps
+def provide_json_dumps_bytes_func(json_dumps_module: Literal['json', 'orjson']) -> Callable[[Any], bytes]:
+    if json_dumps_module == 'orjson':
+        if not import_checker.is_orjson_installed:
+            raise MissingDependencyError('orjson')
+        return orjson_helper.json_dumps_bytes
+    return json_helper.json_dumps_bytes
 
 
 class JsonFormatterMixin:
+    # No `__slots__` here: `logging.Formatter` instances have `__dict__` anyway,
+    # and non-empty slots conflict with the C layout of `picologging.Formatter`.
     def __init__(
         self,
         *args: Any,
@@ -81,33 +93,44 @@ class JsonFormatterMixin:
         super().__init__(*args, **kwargs)
         json_dumps_module = json_dumps_module or _get_default_json_dumps_module()
         self.json_dumps = provide_json_dumps_func(json_dumps_module)
+        self.json_dumps_bytes = provide_json_dumps_bytes_func(json_dumps_module)
         self.capture_extra_fields = capture_extra_fields
+        # default fields are the same for every record, so reserved keys are merged once
+        self._reserved_attrs = RESERVED_ATTRS | frozenset(get_logging_defaults())
 
     def format(self, record: 'LogRecord') -> str:
         message = self._prepare_log_dict(record)
         return self.json_dumps(message)
 
+    def format_bytes(self, record: 'LogRecord') -> bytes:
+        """The same as `format` but returns UTF-8 encoded bytes (used by `BytesStreamHandler`)."""
+        message = self._prepare_log_dict(record)
+        return self.json_dumps_bytes(message)
+
     def _prepare_log_extra(self, record: 'LogRecord') -> dict[str, Any]:
         extra = get_log_extra()
         if extra:
             return extra
-        if hasattr(record, 'binded_ctx_extra'):
-            return cast('dict[str, Any]', record.binded_ctx_extra)
-        return {}
+        return cast('dict[str, Any]', getattr(record, 'binded_ctx_extra', None) or {})
 
     def _prepare_log_dict(self, record: 'LogRecord') -> dict[str, Any]:  # noqa: WPS210
-        log_record: dict[str, Any] = {}
-        log_record['timestamp'] = timestamp_to_iso(record.created)
-        log_record['level'] = record.levelname
-        log_record['message'] = record.getMessage()
-        log_record['params'] = {
-            'call_filepath': f'{record.pathname}:{record.lineno}',
-            'logger_name': record.name,
+        msg = record.msg
+        # most of the messages have no args, so there is nothing to interpolate
+        message = msg if not record.args and isinstance(msg, str) else record.getMessage()
+        log_record: dict[str, Any] = {
+            'timestamp': timestamp_to_iso(record.created),
+            'level': record.levelname,
+            'message': message,
+            'params': {
+                'call_filepath': _call_filepath(record.pathname, record.lineno),
+                'logger_name': record.name,
+            },
         }
-        if record.exc_info:
-            exc_type, exc_value, tb = record.exc_info
+        # exc_info is (None, None, None) when logger.exception is called outside of `except` block
+        exc_type, exc_value, tb = record.exc_info or (None, None, None)
+        if exc_type is not None:
             log_record['error'] = {
-                'code': exc_type.__class__.__name__,
+                'code': exc_type.__name__,
                 'message': repr(exc_value),
                 'stack': format_tb(tb),
                 'params': {},
@@ -117,7 +140,7 @@ class JsonFormatterMixin:
         update_fields_with_nested(log_record, default_data)
         update_fields_with_nested(log_record, extra_request_data)
         if self.capture_extra_fields:
-            local_extra_fields = grab_record_extra_fields(record, reserved=RESERVED_ATTRS | set(default_data))
+            local_extra_fields = grab_record_extra_fields(record, reserved=self._reserved_attrs)
             update_fields_with_nested(log_record, local_extra_fields)
         return log_record
 
@@ -132,12 +155,32 @@ if import_checker.is_picologging_installed:
         """Formatter for use with picologging library"""
 
 
-def timestamp_to_iso(timestamp: float) -> str:
-    return (
-        dt.datetime.fromtimestamp(timestamp, tz=dt.timezone.utc)
-        .isoformat(timespec='milliseconds')
-        .replace('+00:00', 'Z')
-    )
+@lru_cache(maxsize=1024)  # noqa: WPS432
+def _call_filepath(pathname: str, lineno: int) -> str:
+    # records come from a limited set of call sites, so the same string is reused instead of building a new one
+    return f'{pathname}:{lineno}'
+
+
+# (second, formatted second) of the last timestamp.
+# There are usually many records per second, so the date part is formatted once and reused.
+_last_second_prefix: tuple[int, str] = (-1, '')
+_MICROSECONDS_IN_SECOND: Final = 1_000_000
+
+
+def timestamp_to_iso(timestamp: float) -> str:  # noqa: WPS210
+    global _last_second_prefix  # noqa: PLW0603, WPS420
+    # same rounding to microseconds as datetime.fromtimestamp does
+    second = int(timestamp)
+    micros = round((timestamp - second) * _MICROSECONDS_IN_SECOND)
+    if micros >= _MICROSECONDS_IN_SECOND:
+        second += 1
+        micros -= _MICROSECONDS_IN_SECOND
+    cached_second, prefix = _last_second_prefix
+    if second != cached_second:
+        prefix = dt.datetime.fromtimestamp(second, tz=dt.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+        _last_second_prefix = (second, prefix)  # noqa: WPS122, WPS442
+    millis = micros // 1000
+    return f'{prefix}.{millis:03d}Z'
 
 
 @lru_cache(maxsize=1)
@@ -161,9 +204,18 @@ def update_fields_with_nested(
     'a.b.c': 'hello' -> {'a': {'b': {'c': 'hello'}}}
     """
     for field_name, field_value in updated_fields.items():
+        if not isinstance(field_name, str) or '.' not in field_name:  # type:ignore[redundant-expr]
+            source_data[field_name] = field_value
+            continue
         here = source_data
-        keys = field_name.split('.')
+        keys = _split_key(field_name)
         for key in keys[:-1]:
             here = here.setdefault(key, {})
         here[keys[-1]] = field_value
     return source_data
+
+
+@lru_cache(maxsize=256)  # noqa: WPS432
+def _split_key(field_name: str) -> tuple[str, ...]:
+    # the same nested keys (e.g. 'request.id') come with every record
+    return tuple(field_name.split('.'))
@@ -4,3 +4,7 @@ from typing import Any
 
 def json_dumps(obj_to_serialize: Any) -> str:
     return json.dumps(obj_to_serialize, ensure_ascii=False)
+
+
+def json_dumps_bytes(obj_to_serialize: Any) -> bytes:
+    return json_dumps(obj_to_serialize).encode()
@@ -1,20 +1,27 @@
 import atexit
+import copy
 import logging
+import os
 import sys
+import threading
+import weakref
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
-from typing import Any, cast
+from queue import Empty, Full, Queue, SimpleQueue
+from typing import TYPE_CHECKING, Any, AnyStr, Final, cast
 
 from modern_pylogging.contextvars_helpers import get_log_extra
 from modern_pylogging.helper_utils import resolve_handlers
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class LoggingQueueListener(QueueListener):
     """Custom `QueueListener` that starts and stops the listening thread."""
 
     def __init__(
         self,
-        queue: Queue[logging.LogRecord],
+        queue: 'SimpleQueue[logging.LogRecord] | Queue[logging.LogRecord]',
         *handlers: logging.Handler,
         respect_handler_level: bool = False,
     ) -> None:
@@ -28,21 +35,315 @@ class LoggingQueueListener(QueueListener):
         """
         super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
         self.start()
-        atexit.register(self.stop)
+
+    # max number of records taken from the queue at once
+    batch_size = 256
+
+    def start(self) -> None:
+        super().start()
+        _active_listeners.add(self)
+
+    def stop(self) -> None:
+        # The listener's thread waits on `queue.get()` without a timeout and the sentinel wakes it up at once,
+        # so stopping takes only as long as writing the records left in the queue.
+        _active_listeners.discard(self)
+        # older pythons fail if the listener is stopped twice
+        if self.is_running:
+            super().stop()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the listener's thread is started (and not stopped yet)."""
+        return self._thread is not None
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """
+        The same as `handle` but for several records.
+        Handlers with `handle_batch` method (e.g. `BatchingStreamHandler`) get all the records at once.
+        """
+        records = [self.prepare(record) for record in records]
+        for target_handler in self.handlers:
+            if self.respect_handler_level:
+                handler_records = [record for record in records if record.levelno >= target_handler.level]
+            else:
+                handler_records = records
+            handle_batch = getattr(target_handler, 'handle_batch', None)
+            if handle_batch is not None:
+                handle_batch(handler_records)
+                continue
+            for record in handler_records:
+                target_handler.handle(record)
+
+    def _monitor(self) -> None:
+        # The same as `QueueListener._monitor` but records are taken from the queue
+        # and handled in batches, so a lot of records logged at once are written together.
+        task_done = getattr(self.queue, 'task_done', None)
+        is_stopped = False
+        while not is_stopped:
+            records, is_stopped = self._dequeue_batch()
+            if records:
+                self.handle_batch(records)
+            if task_done is not None:
+                for _ in range(len(records) + is_stopped):
+                    task_done()
+
+    def _dequeue_batch(self) -> tuple[list[logging.LogRecord], bool]:
+        """Waits for a record and takes the records which are already in the queue (up to `batch_size`)."""
+        records: list[logging.LogRecord] = []
+        record = self.dequeue(block=True)
+        # The listener is the only consumer, so `qsize()` records can be taken without waiting.
+        # It's cheaper than taking records until `Empty` is raised (with a low rate it'd be raised for every record)
+        queue = cast('SimpleQueue[logging.LogRecord]', self.queue)
+        try:
+            ready_count = min(queue.qsize(), self.batch_size - 1)
+        except NotImplementedError:
+            # e.g. `multiprocessing.Queue` on macOS
+            ready_count = 0
+        while record is not self._sentinel:  # type:ignore[attr-defined]
+            records.append(record)
+            if len(records) > ready_count:
+                return records, False
+            try:
+                record = self.dequeue(block=False)
+            except Empty:
+                # `qsize()` of some queues is only approximate (e.g. `multiprocessing.Queue`)
+                return records, False
+        return records, True
+
+
+# Started listeners. They are stopped at exit, so records left in the queues are written.
+_active_listeners: 'weakref.WeakSet[LoggingQueueListener]' = weakref.WeakSet()
+
+
+def _stop_listeners() -> None:
+    for listener in tuple(_active_listeners):
+        listener.stop()
+
+
+def _forget_listeners_in_child() -> None:
+    # Threads are not copied into a forked process, so there is nothing to stop at child's exit.
+    # (A queue can't be reused in the child either, its lock could be held by the parent's listener thread)
+    _active_listeners.clear()
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    os.register_at_fork(after_in_child=_forget_listeners_in_child)
+
+
+class BatchingStreamHandler(logging.StreamHandler):  # type:ignore[type-arg]
+    """
+    StreamHandler which writes a batch of records from `LoggingQueueListener`
+    with a single `write` and `flush` call to the stream.
+    Records passed one by one (with `handle`) are written as usual.
+    """
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        msgs = [self._format_batch_record(record, self.format) for record in records]
+        batch = ''.join([msg + self.terminator for msg in msgs if msg is not None])
+        if batch:
+            self._write_batch(batch, records[-1])
+
+    def _format_batch_record(
+        self,
+        record: logging.LogRecord,
+        format_record: 'Callable[[logging.LogRecord], AnyStr]',
+    ) -> AnyStr | None:
+        # since python 3.12 filters can return a changed record
+        filtered_record: bool | logging.LogRecord = self.filter(record)
+        if not filtered_record:
+            return None
+        if isinstance(filtered_record, logging.LogRecord):
+            record = filtered_record
+        try:
+            return format_record(record)
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+        return None
+
+    def _write_batch(self, batch: str | bytes, last_record: logging.LogRecord) -> None:
+        with self.lock:  # type:ignore[union-attr]
+            try:
+                if isinstance(batch, bytes):
+                    # text layer of the stream could still hold something (e.g. from `print`), keep the order
+                    self.stream.flush()
+                    self.stream.buffer.write(batch)
+                else:
+                    self.stream.write(batch)
+                self.flush()
+            except RecursionError:
+                raise
+            except Exception:  # noqa: BLE001
+                self.handleError(last_record)
+
+
+class BytesStreamHandler(BatchingStreamHandler):
+    """
+    StreamHandler which writes records straight into the binary buffer of the stream (e.g. `sys.stdout.buffer`).
+
+    It works only if the formatter can produce bytes (JsonFormatter has `format_bytes` method).
+    With 'orjson' it saves decoding of the serialized record into `str`
+    and encoding it back into bytes by the text stream.
+    Otherwise, it works as a regular StreamHandler.
+    Batches of records from `LoggingQueueListener` are written at once, as in `BatchingStreamHandler`.
+    """
+
+    terminator_bytes = b'\n'
+
+    def emit(self, record: logging.LogRecord) -> None:
+        format_bytes = getattr(self.formatter, 'format_bytes', None)
+        buffer = getattr(self.stream, 'buffer', None)
+        if format_bytes is None or buffer is None:
+            super().emit(record)
+            return
+        try:
+            msg = format_bytes(record)
+            # text layer of the stream could still hold something (e.g. from `print`), keep the order
+            self.stream.flush()
+            buffer.write(msg + self.terminator_bytes)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        format_bytes = getattr(self.formatter, 'format_bytes', None)
+        if format_bytes is None or getattr(self.stream, 'buffer', None) is None:
+            super().handle_batch(records)
+            return
+        msgs = [self._format_batch_record(record, format_bytes) for record in records]
+        batch = b''.join([msg + self.terminator_bytes for msg in msgs if msg is not None])
+        if batch:
+            self._write_batch(batch, records[-1])
 
 
-class QueueListenerHandler(QueueHandler):
+class _StdoutHandler(logging.StreamHandler):  # type:ignore[type-arg]
+    """
+    The same as `logging.lastResort` handler, but writes to `sys.stdout` which is current at the moment
+    (unless another stream is set with `setStream`).
+    """
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+        self._stream: Any = None
+
+    @property
+    def stream(self) -> Any:
+        return sys.stdout if self._stream is None else self._stream
+
+    @stream.setter
+    def stream(self, new_stream: Any) -> None:
+        self._stream = new_stream
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    With a bounded queue (e.g. `Queue(maxsize=10000)`) records are dropped instead of blocking
+    the logging thread when the queue is full. ERROR and CRITICAL records wait up to `error_put_timeout`
+    seconds for a place in the queue, they are dropped only if it doesn't drain in time
+    (or right away, when the listener is stopped). Records are put without the handler's lock,
+    so only the thread logging such a record waits.
+    A WARNING about dropped records is sent to the queue every `drop_warning_every` dropped records
+    (if there is no place for it, it's sent next time a record gets into the queue).
+    """
+
+    drop_warning_every = 1000
+    error_put_timeout = 1.0
+
+    def __init__(self, queue: 'SimpleQueue[logging.LogRecord] | Queue[logging.LogRecord]') -> None:
+        super().__init__(queue)
+        self.dropped_count = 0
+        self._warning_pending = False
+        self._drop_lock = threading.Lock()
+
+    def handle(self, record: logging.LogRecord) -> Any:  # noqa: WPS110
+        # The same as `Handler.handle` but without the handler's lock around `emit`:
+        # queues are thread-safe, and an ERROR record waiting for a place in a full queue
+        # must not stop other threads from logging
+        # since python 3.12 filters can return a changed record
+        filtered_record: bool | logging.LogRecord = self.filter(record)
+        if isinstance(filtered_record, logging.LogRecord):
+            record = filtered_record
+        if filtered_record:
+            self.emit(record)
+        return filtered_record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            if record.levelno < logging.ERROR or not self._put_error(record):
+                self._count_dropped()
+            return
+        if self._warning_pending:
+            self._put_dropped_warning()
+
+    def _put_error(self, record: logging.LogRecord) -> bool:
+        listener = getattr(self, 'listener', None)
+        if listener is not None and not getattr(listener, 'is_running', True):
+            # a stopped listener never drains the queue
+            return False
+        try:
+            cast('Queue[logging.LogRecord]', self.queue).put(record, timeout=self.error_put_timeout)
+        except Full:
+            return False
+        return True
+
+    def _count_dropped(self) -> None:
+        with self._drop_lock:
+            self.dropped_count += 1
+            if self.dropped_count % self.drop_warning_every == 0:
+                self._warning_pending = True
+        self._put_dropped_warning()
+
+    def _put_dropped_warning(self) -> None:
+        with self._drop_lock:
+            if not self._warning_pending:
+                return
+            try:
+                self.queue.put_nowait(_dropped_records_warning(self.dropped_count))
+            except Full:
+                return
+            self._warning_pending = False
+
+
+def _dropped_records_warning(dropped_count: int) -> logging.LogRecord:
+    return logging.LogRecord(
+        'modern_pylogging',
+        logging.WARNING,
+        __file__,
+        0,
+        'Logging queue is full, %d records have been dropped so far',
+        (dropped_count,),
+        None,
+    )
+
+
+class QueueListenerHandler(DroppingQueueHandler):
     """
     Configure queue listener and handler to support non-blocking logging configuration.
 
+    With `max_queue_size` the queue is bounded, read about it in `DroppingQueueHandler`.
+
     !caution!
     This handler DOES NOT WORK with Python >= 3.12 and `logging.config.dictConfig`.
     Please use `QueueHandlerContextVarsHappyPy312`
     """
 
-    def __init__(self, handlers: list[Any] | None = None, respect_handler_level: bool = False) -> None:  # noqa: FBT001, FBT002
-        super().__init__(Queue(-1))
-        handlers = resolve_handlers(handlers) if handlers else [logging.StreamHandler(stream=sys.stdout)]
+    def __init__(
+        self,
+        handlers: list[Any] | None = None,
+        respect_handler_level: bool = False,  # noqa: FBT001, FBT002
+        max_queue_size: int = 0,
+    ) -> None:
+        # The C implemented SimpleQueue is used for unbounded queues.
+        # It doesn't take a lock with Condition for every `put` as `Queue` does
+        super().__init__(Queue(max_queue_size) if max_queue_size > 0 else SimpleQueue())
+        # each queue handler gets a handler of its own, so its level, formatter and filters are not shared
+        handlers = resolve_handlers(handlers) if handlers else [_StdoutHandler()]
         self.listener = LoggingQueueListener(
             self.queue,  # type:ignore[arg-type]
             *handlers,
@@ -50,7 +351,7 @@ class QueueListenerHandler(QueueHandler):
         )
 
 
-class QueueHandlerContextVarsHappyPy312(QueueHandler):
+class QueueHandlerContextVarsHappyPy312(DroppingQueueHandler):
     """
     In python up to version 3.12 JsonFormatter was called in the same thread as logging
     and placed already formatted string directly into the queue.
@@ -60,9 +361,45 @@ class QueueHandlerContextVarsHappyPy312(QueueHandler):
     and the queue processing is handled by QueueListener in a separate thread.
     Since ContextVars are not shared between threads, any data that was set using `update_log_extra` will be lost.
     To prevent this from happening, I created this handler and modified the JsonFormatter.
+
+    A bounded queue can be set with `queue` parameter, read about it in `DroppingQueueHandler`.
     """
 
     def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
-        record = super().prepare(record)
-        record.binded_ctx_extra = get_log_extra()
-        return cast('logging.LogRecord', record)
+        # `QueueHandler.prepare` formats the whole record (with the handler's formatter or the default one)
+        # and drops `exc_info` (the traceback becomes a part of the message).
+        # It's still needed when the handler has a formatter of its own
+        # or when records leave the process (tracebacks can't be pickled, e.g. with `multiprocessing.Queue`).
+        prepared_record: logging.LogRecord
+        if self.formatter is not None or not isinstance(self.queue, _PROCESS_LOCAL_QUEUE_TYPES):
+            prepared_record = super().prepare(record)
+        else:
+            prepared_record = _prepare_local_record(record)
+        prepared_record.binded_ctx_extra = get_log_extra()
+        return prepared_record
+
+
+# records put into these queues stay in the process
+_PROCESS_LOCAL_QUEUE_TYPES: Final = (Queue, SimpleQueue)
+
+
+def _prepare_local_record(record: logging.LogRecord) -> logging.LogRecord:
+    # The listener's handlers format the records anyway,
+    # so the message is merged here only when it could be changed after the logging call
+    # (or its `__str__` reads ContextVars): a non-str `msg` or mutable args.
+    # A str message with immutable args is left for the listener's thread.
+    record = copy.copy(record)
+    if type(record.msg) is not str or (record.args and not _are_immutable(record.args)):  # noqa: WPS516
+        record.msg = record.getMessage()
+        record.args = None
+    return record
+
+
+# logging args of these types can't be changed after the logging call
+_IMMUTABLE_ARG_TYPES: Final = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _are_immutable(args: Any) -> bool:
+    # args are a dict with `logger.info('%(key)s', {'key': 'value'})`.
+    # Exact types are checked, subclasses could be mutable
+    return isinstance(args, tuple) and all(type(arg) in _IMMUTABLE_ARG_TYPES for arg in args)  # noqa: WPS516
@@ -4,15 +4,18 @@ Sometimes you don't know your settings in import time
 So you can't
 """
 
+import contextlib
 import logging
-import threading
 from collections.abc import Callable
-from typing import Any, cast
+from typing import Any, Final, cast
 
 from modern_pylogging.helper_types import Logger
 
 fallback_logger = logging.getLogger('modern_pylogging.fallback')
 
+# methods of the real logger which are bound to the proxy itself, so calls skip `__getattr__`
+_FORWARDED_METHODS: Final = ('debug', 'info', 'warning', 'error', 'critical', 'exception', 'log', 'isEnabledFor')
+
 
 class LoggerProxy:
     """Lazy logger object that does nothing until logging is configured.
@@ -24,28 +27,52 @@ class LoggerProxy:
     After that every call is going to be proxied to the real logger object.
     """
 
+    # slots for the logging methods are filled when the real logger is resolved
+    __slots__ = ('__weakref__', '_real_logger', 'factory', 'fallback_logger', 'name', *_FORWARDED_METHODS)
+
     def __init__(self, name: str) -> None:
         self.name = name
         self._real_logger: Logger | None = None
         self.factory: Callable[[str], Logger] | None = None
-        self.lock = threading.Lock()
         self.fallback_logger = fallback_logger
 
     @property
     def real_logger(self) -> Logger:
-        if self._real_logger is None:
-            with self.lock:
-                if self._real_logger is None and self.factory is None:  # type: ignore[redundant-expr]
-                    err_msg = 'Logging is not set up yet. Please create LoggingConfig and call configure method first'
-                    self.fallback_logger.error(err_msg)
-                    return self.fallback_logger
-                self._real_logger = self.factory(self.name)
-        return self._real_logger
+        if self._real_logger is not None:
+            return self._real_logger
+        if self.factory is None:
+            err_msg = 'Logging is not set up yet. Please create LoggingConfig and call configure method first'
+            self.fallback_logger.error(err_msg)
+            return self.fallback_logger
+        return self._bind_real_logger(self.factory)
 
     def __getattr__(self, item: str) -> Any:  # noqa: WPS110
-        # Forward all attribute access to the real logger
+        # Forward all attribute access to the real logger.
+        # (Not `__getattribute__`: it would run Python code for every attribute,
+        # including the logging methods bound in slots, which are read directly now)
         return getattr(self.real_logger, item)
 
+    def use_factory(self, factory: Callable[[str], Logger]) -> None:
+        # resolve the real logger right away, so logging calls never go through `__getattr__`
+        # (and resolve it again when logging is configured once more with another backend)
+        if factory is not self.factory or self._real_logger is None:
+            self.factory = factory
+            self._bind_real_logger(factory)
+
+    def _bind_real_logger(self, factory: Callable[[str], Logger]) -> Logger:
+        # getLogger returns the same logger for the same name, so there is no need in a lock
+        real_logger = factory(self.name)
+        self._real_logger = real_logger
+        for method_name in _FORWARDED_METHODS:
+            method = getattr(real_logger, method_name, None)
+            if method is None:
+                # do not keep a method of the previous real logger
+                with contextlib.suppress(AttributeError):
+                    delattr(self, method_name)  # noqa: WPS421
+            else:
+                setattr(self, method_name, method)
+        return real_logger
+
 
 # Global registry
 _proxy_loggers: dict[str, LoggerProxy] = {}
@@ -56,14 +83,17 @@ def setup_proxy_loggers(real_get_logger_fn: Callable[..., Logger]) -> None:
     global _logger_factory  # noqa: PLW0603, WPS420
     _logger_factory = real_get_logger_fn  # noqa: WPS122
     # update all existing logger proxies
-    for proxy in _proxy_loggers.values():
-        proxy.factory = real_get_logger_fn
+    # (a snapshot, as other threads could create new loggers meanwhile)
+    for proxy in tuple(_proxy_loggers.values()):
+        proxy.use_factory(real_get_logger_fn)
 
 
 def get_logger(name: str) -> Logger:
-    if name not in _proxy_loggers:
-        proxy = LoggerProxy(name)
-        if _logger_factory:
-            proxy.factory = _logger_factory
-        _proxy_loggers[name] = proxy
-    return cast('Logger', _proxy_loggers[name])
+    proxy = _proxy_loggers.get(name)
+    if proxy is None:
+        new_proxy = LoggerProxy(name)
+        if _logger_factory is not None:
+            new_proxy.use_factory(_logger_factory)
+        # if several threads create the same logger, all of them get the first one
+        proxy = _proxy_loggers.setdefault(name, new_proxy)
+    return cast('Logger', proxy)
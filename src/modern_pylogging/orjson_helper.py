@@ -1,3 +1,5 @@
+from collections.abc import Callable
+from decimal import Decimal
 from typing import Any
 
 from modern_pylogging import import_checker
@@ -8,14 +10,36 @@ if import_checker.is_orjson_installed:
 else:
     raise MissingDependencyError('orjson')
 
+# OPT_NON_STR_KEYS - serialize numeric keys like stdlib json does (instead of raising TypeError)
+# OPT_UTC_Z - write UTC datetimes with 'Z' the same way as the record's timestamp
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+# types orjson can't serialize itself, looked up by exact type (a single dict lookup)
+_converters: dict[type, Callable[[Any], Any]] = {
+    set: list,
+    frozenset: list,
+    type({}.keys()): list,
+    type({}.values()): list,
+    Decimal: str,
+}
+
 
 def default(obj_to_serialize: Any) -> Any:
     """See https://github.com/ijl/orjson#default for information."""
-    if isinstance(obj_to_serialize, set):
+    converter = _converters.get(type(obj_to_serialize))
+    if converter is not None:
+        return converter(obj_to_serialize)
+    if isinstance(obj_to_serialize, (set, frozenset)):
+        # subclasses
         return list(obj_to_serialize)
     raise TypeError
 
 
 def json_dumps(obj_to_serialize: Any) -> str:
     # orjson.dumps returns bytes, to match standart json.dumps we need to decode
-    return orjson.dumps(obj_to_serialize, default=default).decode()
+    return orjson.dumps(obj_to_serialize, default=default, option=ORJSON_OPTIONS).decode()
+
+
+def json_dumps_bytes(obj_to_serialize: Any) -> bytes:
+    return orjson.dumps(obj_to_serialize, default=default, option=ORJSON_OPTIONS)
@@ -1,6 +1,6 @@
 import atexit
 import sys
-from queue import Queue
+from queue import SimpleQueue
 from typing import IO, Any
 
 from modern_pylogging.helper_utils import MissingDependencyError, resolve_handlers
@@ -31,7 +31,8 @@ class QueueListenerHandler(QueueHandler):
         handlers: list[Any] | None = None,
     ) -> None:
         # handlers are ConvertingList (from logging.config
-        super().__init__(Queue(-1))
+        # unbounded SimpleQueue is much cheaper than Queue(-1), read `logging_handlers.QueueListenerHandler`
+        super().__init__(SimpleQueue())
         """
         In the builtin logging setup, when configured through a DictConfig
         the ConvertingList entity is passed to the handlers.
@@ -1,4 +1,3 @@
-import atexit
 import contextlib
 import logging
 import sys
@@ -27,14 +26,17 @@ def cleanup_logging_impl() -> Generator[None, None, None]:
     # so tests could configure logging without affecting each other
     std_root_logger: logging.Logger = logging.getLogger()
     name_of_loggers_exist_on_start = set(std_root_logger.manager.loggerDict)
-    for std_handler in std_root_logger.handlers:
-        # Do not interfere with pytest handler config
-        if not isinstance(std_handler, (_LiveLoggingNullHandler, LogCaptureHandler)):
-            std_root_logger.removeHandler(std_handler)
+    # Do not interfere with pytest handler config
+    # (the list is rebuilt, removing handlers while iterating over them would skip some of them)
+    std_root_logger.handlers = [
+        std_handler
+        for std_handler in std_root_logger.handlers
+        if isinstance(std_handler, (_LiveLoggingNullHandler, LogCaptureHandler))
+    ]
 
     # reset root logger (`picologging` module)
     pico_root_logger: picologging.Logger = picologging.getLogger()
-    for pico_handler in pico_root_logger.handlers:
+    for pico_handler in tuple(pico_root_logger.handlers):
         pico_root_logger.removeHandler(pico_handler)
 
     yield
@@ -43,13 +45,11 @@ def cleanup_logging_impl() -> Generator[None, None, None]:
     # else the test suite would hand on at the end of the tests and some tests would fail)
     queue_listener_handler = getHandlerByName('queue_handler')
     if queue_listener_handler and hasattr(queue_listener_handler, 'listener'):
-        atexit.unregister(queue_listener_handler.listener.stop)
         queue_listener_handler.listener.stop()
         queue_listener_handler.close()
         del queue_listener_handler  # noqa: WPS420
 
-    name_of_loggers_exist_on_end = set(std_root_logger.manager.loggerDict)
-    for name in name_of_loggers_exist_on_end - name_of_loggers_exist_on_start:
+    for name in std_root_logger.manager.loggerDict.keys() - name_of_loggers_exist_on_start:
         std_root_logger.manager.loggerDict.pop(name)
 
     # reset lazy loggers
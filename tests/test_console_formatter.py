@@ -0,0 +1,14 @@
+import logging
+
+import modern_pylogging
+from modern_pylogging.console_formatter import ConsoleFormatterLogging
+
+
+async def test_console_formatter_extra_data() -> None:  # noqa: RUF029
+    # async test runs in its own context, so update_log_extra does not leak into other tests
+    formatter = ConsoleFormatterLogging('%(message)s | %(extra_data_str)s')
+    test_record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg='msg', args=(), exc_info=None)
+    assert formatter.format(test_record) == 'msg | '
+
+    modern_pylogging.update_log_extra({'user_id': 1, 'request.id': 'abc'})
+    assert formatter.format(test_record) == 'msg | {user_id = 1, request.id = abc}'
@@ -0,0 +1,29 @@
+import asyncio
+
+from modern_pylogging.contextvars_helpers import get_log_extra, set_log_extra, update_log_extra
+
+
+async def update_in_child_task() -> None:  # noqa: RUF029
+    update_log_extra({'child': 'value'})
+
+
+async def test_child_task_does_not_change_parent_extra() -> None:
+    update_log_extra({'parent': 'value'})
+    parent_extra = get_log_extra()
+
+    await asyncio.create_task(update_in_child_task())
+
+    assert parent_extra == {'parent': 'value'}
+    assert get_log_extra() == {'parent': 'value'}
+
+
+async def test_set_log_extra_stores_copy() -> None:  # noqa: RUF029
+    log_extra = {'request_id': 1}
+    set_log_extra(log_extra)
+    stored_extra = get_log_extra()
+
+    log_extra['request_id'] = 2
+
+    assert stored_extra == {'request_id': 1}
+    # the same dict is returned until the next update
+    assert get_log_extra() is stored_extra
@@ -1,6 +1,9 @@
+import logging
 import os
+import sys
+from logging.config import DictConfigurator
 
-from modern_pylogging.helper_utils import get_logging_level
+from modern_pylogging.helper_utils import get_logging_level, resolve_handlers
 from modern_pylogging.json_formatter import get_logging_defaults
 
 
@@ -18,3 +21,12 @@ def test_get_logging_level_str() -> None:
     os.environ['LOGGING_LEVEL'] = '1'
     assert get_logging_level() == 1
     os.environ.pop('LOGGING_LEVEL', None)
+
+
+def test_resolve_handlers() -> None:
+    handler = logging.StreamHandler()
+    assert resolve_handlers([handler]) == [handler]
+
+    # ConvertingList converts its items on indexing
+    configurator = DictConfigurator({'handlers_list': ['ext://sys.stdout']})
+    assert resolve_handlers(configurator.config['handlers_list']) == [sys.stdout]  # type:ignore[attr-defined]
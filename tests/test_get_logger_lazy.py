@@ -30,6 +30,9 @@ class DummyLogger:
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa:ARG002
         self.calls.append(('error', msg))
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        return level >= logging.INFO
+
 
 def dummy_factory(name: str) -> DummyLogger:
     return DummyLogger(name)
@@ -97,3 +100,46 @@ def test_fallback_logs_visible_to_stdout(caplog: LogCaptureFixture) -> None:
         logger = get_logger('fallback_visible_test')
         logger.warning('Before setup')  # proxy triggers fallback
         assert 'Logging is not set up yet' in caplog.text
+
+
+def test_logger_methods_bound_after_setup() -> None:
+    setup_proxy_loggers(dummy_factory)  # type:ignore[arg-type]
+    logger = get_logger('bound_methods_test')
+    logger.info('First message')
+
+    real_logger = logger.real_logger  # type:ignore[attr-defined]
+    # calls go straight to the real logger's methods, without `__getattr__`
+    assert logger.info == real_logger.info
+    assert object.__getattribute__(logger, 'info') == real_logger.info  # noqa: PLC2801
+    logger.error('Second message')
+    assert real_logger.calls == [('info', 'First message'), ('error', 'Second message')]
+
+
+def test_existing_proxy_bound_on_setup() -> None:
+    logger = get_logger('bound_on_setup_test')
+    setup_proxy_loggers(dummy_factory)  # type:ignore[arg-type]
+
+    # real logger is resolved by setup, before the first call
+    assert isinstance(object.__getattribute__(logger, 'info').__self__, DummyLogger)  # noqa: PLC2801
+
+
+def test_is_enabled_for_bound_after_setup() -> None:
+    setup_proxy_loggers(dummy_factory)  # type:ignore[arg-type]
+    logger = get_logger('is_enabled_for_test')
+
+    assert logger.isEnabledFor(logging.INFO)
+    assert not logger.isEnabledFor(logging.DEBUG)
+    real_logger = logger.real_logger  # type:ignore[attr-defined]
+    assert object.__getattribute__(logger, 'isEnabledFor') == real_logger.isEnabledFor  # noqa: PLC2801
+
+
+def test_existing_proxy_rebound_on_new_setup() -> None:
+    logger = get_logger('rebound_test')
+    setup_proxy_loggers(logging.getLogger)
+    setup_proxy_loggers(dummy_factory)  # type:ignore[arg-type]
+
+    real_logger = logger.real_logger  # type:ignore[attr-defined]
+    assert logger.info == real_logger.info
+    assert isinstance(real_logger, DummyLogger)
+    # methods of the previous real logger are not kept
+    assert not hasattr(logger, 'critical')
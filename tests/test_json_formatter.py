@@ -1,12 +1,25 @@
+import datetime as dt
+import gc
 import json
 import logging
+import sys
+import weakref
+from decimal import Decimal
 from types import ModuleType
 
 import picologging
 import pytest
 
 import modern_pylogging
-from modern_pylogging.json_formatter import JsonFormatterLogging, JsonFormatterPicologging
+from modern_pylogging.json_formatter import (
+    RESERVED_ATTRS,
+    JsonFormatterLogging,
+    JsonFormatterPicologging,
+    grab_record_extra_fields,
+    timestamp_to_iso,
+    update_fields_with_nested,
+)
+from modern_pylogging.orjson_helper import json_dumps as orjson_dumps
 
 
 @pytest.mark.parametrize('json_module', ['json', 'orjson', None])
@@ -75,3 +88,133 @@ async def test_extra_param_override_contextvars_params(logging_module: ModuleTyp
     decoded_json = json.loads(formatter.format(test_record))
 
     assert decoded_json['test_param'] == 'test_value from extra='
+
+
+@pytest.mark.parametrize('timestamp', [0, 1.5, 1700000000.0, 1700000000.123, 1700000000.9995, 1700000000.9999996])
+def test_timestamp_to_iso(timestamp: float) -> None:
+    expected = (
+        dt.datetime.fromtimestamp(timestamp, tz=dt.timezone.utc)
+        .isoformat(timespec='milliseconds')
+        .replace('+00:00', 'Z')
+    )
+    assert timestamp_to_iso(timestamp) == expected
+
+
+@pytest.mark.parametrize(
+    ('msg', 'expected'),
+    [
+        ('100%', '100%'),
+        # non-string messages are still converted to strings
+        ({'key': 'value'}, "{'key': 'value'}"),
+    ],
+)
+@pytest.mark.parametrize('logging_module', [logging, picologging])
+def test_formatter_message_without_args(msg: object, expected: str, logging_module: ModuleType) -> None:
+    formatter = JsonFormatterPicologging() if logging_module.__name__ == 'picologging' else JsonFormatterLogging()
+    test_record = logging_module.LogRecord(
+        'name', logging_module.INFO, 'path', lineno=1, msg=msg, args=(), exc_info=None
+    )
+    assert json.loads(formatter.format(test_record))['message'] == expected
+
+
+@pytest.mark.parametrize('logging_module', [logging, picologging])
+def test_formatter_exception_info(logging_module: ModuleType) -> None:
+    formatter = JsonFormatterPicologging() if logging_module.__name__ == 'picologging' else JsonFormatterLogging()
+    exc_info = (ValueError, ValueError('bad value'), None)
+    test_record = logging_module.LogRecord(
+        'name', logging_module.ERROR, 'path', lineno=1, msg='Error', args=(), exc_info=exc_info
+    )
+
+    error = json.loads(formatter.format(test_record))['error']
+
+    assert error['code'] == 'ValueError'
+    assert error['message'] == "ValueError('bad value')"
+    assert error['stack'] == []
+
+    # logger.exception() called outside of `except` block
+    test_record.exc_info = (None, None, None)
+    assert 'error' not in json.loads(formatter.format(test_record))
+
+
+class Payload:
+    """Some object which lives in the frame of a function that logs an exception."""
+
+
+def format_exception_with_local(formatter: JsonFormatterLogging) -> 'weakref.ref[Payload]':
+    payload = Payload()
+    try:
+        int('bad value')
+    except ValueError:
+        error_record = logging.LogRecord(
+            'name', logging.ERROR, 'path', lineno=1, msg='Error', args=(), exc_info=sys.exc_info()
+        )
+        formatter.format(error_record)
+    return weakref.ref(payload)
+
+
+def test_formatter_does_not_keep_traceback_frames() -> None:
+    payload_ref = format_exception_with_local(JsonFormatterLogging())
+    gc.collect()
+    # frames (and their locals) of a formatted traceback must not be kept alive by the formatter
+    assert payload_ref() is None
+
+
+@pytest.mark.parametrize('json_module', ['json', 'orjson'])
+def test_formatter_non_str_keys_and_datetime(json_module: str) -> None:
+    formatter = JsonFormatterLogging(json_dumps_module=json_module, capture_extra_fields=True)  # type:ignore[arg-type]
+    test_record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg='msg', args=(), exc_info=None)
+    test_record.__dict__[3] = 'numeric key'  # type:ignore[index]
+
+    assert json.loads(formatter.format(test_record))['3'] == 'numeric key'
+    if json_module == 'orjson':
+        moment = dt.datetime.fromtimestamp(1, tz=dt.timezone.utc)
+        assert formatter.json_dumps({'moment': moment}) == '{"moment":"1970-01-01T00:00:01Z"}'
+
+
+class SetSubclass(set[int]):
+    """Subclasses of set are serialized too."""
+
+
+def test_orjson_default() -> None:
+    serialized = orjson_dumps({
+        'set': {1},
+        'frozenset': frozenset((2,)),
+        'subclass': SetSubclass((3,)),
+        'keys': {'key': 1}.keys(),
+        'values': {'key': 1}.values(),
+        'decimal': Decimal('1.5'),
+    })
+    assert json.loads(serialized) == {
+        'set': [1],
+        'frozenset': [2],
+        'subclass': [3],
+        'keys': ['key'],
+        'values': [1],
+        'decimal': '1.5',
+    }
+
+
+def test_grab_record_extra_fields() -> None:
+    test_record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg='msg', args=(), exc_info=None)
+    test_record.__dict__['user_id'] = 1
+    test_record.__dict__['_private'] = 2
+    test_record.__dict__[3] = 'numeric key'  # type:ignore[index]
+
+    extra_fields = grab_record_extra_fields(test_record, reserved=RESERVED_ATTRS)
+
+    assert extra_fields['user_id'] == 1
+    assert extra_fields[3] == 'numeric key'  # type:ignore[index]
+    assert '_private' not in extra_fields
+    assert 'msg' not in extra_fields
+    assert 'exc_text' not in extra_fields
+
+
+def test_update_fields_with_nested() -> None:
+    source = {'level': 'INFO', 'params': {'logger_name': 'name'}}
+    updated = update_fields_with_nested(source, {'user': 1, 'params.call': 'x', 'request.headers.host': 'h'})
+    assert updated == {
+        'level': 'INFO',
+        'user': 1,
+        'params': {'logger_name': 'name', 'call': 'x'},
+        'request': {'headers': {'host': 'h'}},
+    }
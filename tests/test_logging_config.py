@@ -1,12 +1,12 @@
-import json
 import logging
 import sys
-import time
 from importlib.util import find_spec
-from queue import Queue
+from queue import SimpleQueue
 from types import ModuleType
 from typing import Any, cast
+from unittest.mock import MagicMock
 
+import orjson
 import picologging
 import pytest
 from _pytest.capture import CaptureFixture
@@ -18,30 +18,53 @@ from modern_pylogging.config_api import (
     _get_default_handlers,
     _get_default_json_dumps_module,
     _get_default_logging_module,
+    default_formatters,
     default_handlers,
     default_picologging_handlers,
 )
 from modern_pylogging.json_formatter import JsonFormatterLogging, JsonFormatterPicologging
+from modern_pylogging.logging_manager import get_logger
+
+_QUEUE_HANDLER_CLS_LOGGING = (
+    logging_handlers.QueueHandlerContextVarsHappyPy312
+    if sys.version_info >= (3, 12, 0)
+    else logging_handlers.QueueListenerHandler
+)
+
+# LoggingConfig(...).configure() is called in every test on purpose (no module scoped fixtures):
+# the autouse `_cleanup_logging` fixture resets logging after each test,
+# so a configuration can't be shared between tests
 
 
 def test_get_default_handlers() -> None:
     assert _get_default_handlers(logging_module='logging') == default_handlers
     assert _get_default_handlers(logging_module='picologging') == default_picologging_handlers
+    # BytesStreamHandler is opt-in, the text stream keeps its encoding and newline settings
+    assert default_handlers['console']['class'] == 'logging.StreamHandler'
+
 
+@pytest.fixture
+def import_checker_mock(mocker: MockerFixture) -> MagicMock:
+    return cast('MagicMock', mocker.patch('modern_pylogging.config_api.import_checker'))
 
-def test_get_default_logging_module(mocker: MockerFixture) -> None:
+
+def test_get_default_logging_module() -> None:
     assert find_spec('picologging')  # should be installed in the test env, simply checking
     assert _get_default_logging_module() == 'picologging'
-    mock = mocker.patch('modern_pylogging.config_api.import_checker')
-    mock.is_picologging_installed = False
+
+
+def test_get_default_logging_module_not_installed(import_checker_mock: MagicMock) -> None:
+    import_checker_mock.is_picologging_installed = False
     assert _get_default_logging_module() == 'logging'
 
 
-def test_get_default_json_module(mocker: MockerFixture) -> None:
+def test_get_default_json_module() -> None:
     assert find_spec('orjson')  # should be installed in the test env, simply checking
     assert _get_default_json_dumps_module() == 'orjson'
-    mock = mocker.patch('modern_pylogging.config_api.import_checker')
-    mock.is_orjson_installed = False
+
+
+def test_get_default_json_module_not_installed(import_checker_mock: MagicMock) -> None:
+    import_checker_mock.is_orjson_installed = False
     assert _get_default_json_dumps_module() == 'json'
 
 
@@ -72,22 +95,21 @@ def test_correct_dict_config_called(
 def test_correct_default_handlers_set(
     picologging_installed: bool,  # noqa: FBT001
     expected_default_handlers: dict[str, dict[str, Any]],
-    mocker: MockerFixture,
+    import_checker_mock: MagicMock,
 ) -> None:
-    mock = mocker.patch('modern_pylogging.config_api.import_checker')
-    mock.is_picologging_installed = picologging_installed
+    import_checker_mock.is_picologging_installed = picologging_installed
     log_config = LoggingConfig()._prepare_config_dict()
     assert log_config['handlers'] == expected_default_handlers
+    assert_handlers_not_copied(log_config['handlers'], expected_default_handlers)
 
 
 @pytest.mark.parametrize(('orjson_exists', 'json_module_name'), [(True, 'orjson'), (False, 'json')])
 def test_correct_json_module_set(
     orjson_exists: bool,  # noqa: FBT001
     json_module_name: str,
-    mocker: MockerFixture,
+    import_checker_mock: MagicMock,
 ) -> None:
-    mock = mocker.patch('modern_pylogging.config_api.import_checker')
-    mock.is_orjson_installed = orjson_exists
+    import_checker_mock.is_orjson_installed = orjson_exists
     log_config = LoggingConfig()._prepare_config_dict()
     assert log_config['formatters']['json_fmt']['json_dumps_module'] == json_module_name
 
@@ -102,6 +124,7 @@ def test_correct_handlers_set_by_param(
 ) -> None:
     log_config = LoggingConfig(logging_module=logging_module)._prepare_config_dict()  # type:ignore[arg-type]
     assert log_config['handlers'] == expected_handlers
+    assert_handlers_not_copied(log_config['handlers'], expected_handlers)
 
 
 @pytest.mark.parametrize(('json_module_name', 'expected_module_name'), [('orjson', 'orjson'), ('json', 'json')])
@@ -113,6 +136,25 @@ def test_correct_json_module_set_by_param(
     assert log_config['formatters']['json_fmt']['json_dumps_module'] == expected_module_name
 
 
+def test_default_formatters_are_not_changed() -> None:
+    log_config = LoggingConfig(logging_module='picologging', json_dumps_module='orjson')._prepare_config_dict()
+    assert log_config['formatters']['json_fmt']['()'] == 'modern_pylogging.json_formatter.JsonFormatterPicologging'
+    assert default_formatters['json_fmt'] == {
+        '()': 'modern_pylogging.json_formatter.JsonFormatterLogging',
+        'json_dumps_module': 'json',
+    }
+    assert 'datefmt' not in default_formatters['standard']
+
+
+def test_override_formatters_copies_only_overridden_handlers() -> None:  # noqa: WPS118
+    log_config = LoggingConfig(
+        logging_module='logging', override_formatters={'console': 'standard'}
+    )._prepare_config_dict()
+    assert log_config['handlers']['console']['formatter'] == 'standard'
+    assert default_handlers['console']['formatter'] == 'json_fmt'
+    assert log_config['handlers']['queue_handler'] is default_handlers['queue_handler']
+
+
 def test_capture_extra_fields_cannot_be_used_with_picologging() -> None:  # noqa: WPS118
     log_config = LoggingConfig(logging_module='picologging', capture_extra_fields=True)._prepare_config_dict()
     assert log_config['formatters']['json_fmt']['capture_extra_fields'] is False
@@ -121,13 +163,7 @@ def test_capture_extra_fields_cannot_be_used_with_picologging() -> None:  # noqa
 @pytest.mark.parametrize(
     ('logging_module', 'expected_handler_class', 'expected_listener_class'),
     [
-        (
-            logging,
-            logging_handlers.QueueHandlerContextVarsHappyPy312
-            if sys.version_info >= (3, 12, 0)
-            else logging_handlers.QueueListenerHandler,
-            logging_handlers.LoggingQueueListener,
-        ),
+        (logging, _QUEUE_HANDLER_CLS_LOGGING, logging_handlers.LoggingQueueListener),
         (
             picologging,
             picologging_handlers.QueueListenerHandler,
@@ -139,7 +175,7 @@ def test_default_queue_listener_handler(
     logging_module: ModuleType,
     expected_handler_class: Any,
     expected_listener_class: Any,
-    capsys: CaptureFixture[str],
+    capfd: CaptureFixture[str],
 ) -> None:
     get_logger = LoggingConfig(
         logging_module=logging_module.__name__,  # type:ignore[arg-type]
@@ -162,28 +198,35 @@ def test_default_queue_listener_handler(
 
     handler = logger.handlers[0]
     assert isinstance(handler, expected_handler_class)
-    assert isinstance(handler.queue, Queue)
+    assert isinstance(handler.queue, SimpleQueue)
 
     assert isinstance(handler.listener, expected_listener_class)
     assert isinstance(handler.listener.handlers[0], logging_module.StreamHandler)
 
     logger.info('Testing now!')
-    assert_log(capsys, handler.queue, expected='INFO :: test_logger :: Testing now!', count=1)
+    assert_log(capfd, handler.listener, expected='INFO :: test_logger :: Testing now!', count=1)
 
     var = 'test_var'
     logger.info('%s', var)
-    assert_log(capsys, handler.queue, expected='INFO :: test_logger :: test_var', count=1)
+    assert_log(capfd, handler.listener, expected='INFO :: test_logger :: test_var', count=1)
+
+
+def test_configure_twice_rebinds_existing_loggers() -> None:
+    proxy = cast('Any', get_logger('app.module'))
+    LoggingConfig(logging_module='picologging').configure()
+    first_logger = proxy.real_logger
+    assert isinstance(first_logger, picologging.Logger)
+
+    LoggingConfig(logging_module='logging').configure()
+    second_logger = proxy.real_logger
+    assert isinstance(second_logger, logging.Logger)
+    assert proxy.info == logging.getLogger('app.module').info
 
 
 @pytest.mark.parametrize(
     ('logging_module', 'expected_handler_class'),
     [
-        (
-            logging,
-            logging_handlers.QueueHandlerContextVarsHappyPy312
-            if sys.version_info >= (3, 12, 0)
-            else logging_handlers.QueueListenerHandler,
-        ),
+        (logging, _QUEUE_HANDLER_CLS_LOGGING),
         (picologging, picologging_handlers.QueueListenerHandler),
     ],
 )
@@ -201,20 +244,21 @@ def test_default_logger_and_handler(logging_module: ModuleType, expected_handler
 @pytest.mark.parametrize('logging_module', [logging, picologging, None])
 def test_default_handlers_formatters(logging_module: ModuleType | None) -> None:
     if logging_module is None:
-        config = LoggingConfig(
+        log_config = LoggingConfig(
             formatters={},
             handlers={},
             loggers={},
-        )._prepare_config_dict()
+        )
         expected_default_handlers = _get_default_handlers(_get_default_logging_module())
     else:
-        config = LoggingConfig(
+        log_config = LoggingConfig(
             logging_module=logging_module.__name__,  # type:ignore[arg-type]
             formatters={},
             handlers={},
             loggers={},
-        )._prepare_config_dict()
+        )
         expected_default_handlers = _get_default_handlers(logging_module.__name__)
+    config = log_config._prepare_config_dict()
 
     assert config['formatters']['json_fmt']
     assert len(config['formatters']) == 2
@@ -226,19 +270,14 @@ def test_default_handlers_formatters(logging_module: ModuleType | None) -> None:
 @pytest.mark.parametrize(
     ('logging_module', 'expected_handler_class'),
     [
-        (
-            logging,
-            logging_handlers.QueueHandlerContextVarsHappyPy312
-            if sys.version_info >= (3, 12, 0)
-            else logging_handlers.QueueListenerHandler,
-        ),
+        (logging, _QUEUE_HANDLER_CLS_LOGGING),
         (picologging, picologging_handlers.QueueListenerHandler),
     ],
 )
 def test_customizing_handler(
     logging_module: ModuleType,
     expected_handler_class: Any,
-    capsys: CaptureFixture[str],
+    capfd: CaptureFixture[str],
 ) -> None:
     log_format = '%(levelname)s :: %(name)s :: %(message)s'
     # picologging seems to be broken, cannot make it log on stdout?
@@ -294,7 +333,7 @@ def test_customizing_handler(
     assert t_logger.handlers[0].formatter._fmt == log_format  # type:ignore[union-attr]
 
     t_logger.info("Hello from '%s'", logging_module.__name__)
-    log_output = capsys.readouterr().out.strip()
+    log_output = capfd.readouterr().out.strip()
     assert log_output == f"INFO :: {t_logger.name} :: Hello from '{logging_module.__name__}'"
 
 
@@ -347,7 +386,7 @@ def test_json_formatter_uses_json_func(
     assert mocked.call_args.args[0]['message'] == f'Hello from {json_module}'
 
 
-def test_default_queue_listener_handler_json_fmt_extra(capsys: CaptureFixture[str]) -> None:  # noqa: WPS118
+def test_default_queue_listener_handler_json_fmt_extra(capfd: CaptureFixture[str]) -> None:  # noqa: WPS118
     """
     Test that we can do logger.info('msg', extra={'hehe': 'pepe'})
     and if configure logging with `capture_extra_fields` option
@@ -367,7 +406,7 @@ def test_default_queue_listener_handler_json_fmt_extra(capsys: CaptureFixture[st
         'Testing one!',
         extra={'simple': 'some text', 'nested.id': 'n_id', 'nested.msg': 'n_msg', 'params.additional': 'something'},
     )
-    log_entry = capture_json_log(capsys, handler.queue)
+    log_entry = capture_json_log(capfd, handler.listener)
 
     assert log_entry['simple'] == 'some text'
     assert log_entry['nested'] == {
@@ -379,30 +418,34 @@ def test_default_queue_listener_handler_json_fmt_extra(capsys: CaptureFixture[st
 
     # logging with extra={} does not affect the following log records
     logger.info('Testing two!')
-    log_entry = capture_json_log(capsys, handler.queue)
+    log_entry = capture_json_log(capfd, handler.listener)
     assert 'simple' not in log_entry
     assert 'nested' not in log_entry
     assert 'additional' not in log_entry['params']
 
 
-def wait_log_queue(queue: Any, sleep_time: float = 0.1, max_retries: int = 5) -> None:
-    retry = 0
-    while queue.qsize() > 0 and retry < max_retries:
-        retry += 1
-        time.sleep(sleep_time)
+def wait_log_queue(listener: Any) -> None:
+    # `stop` returns when the listener has handled everything queued before its sentinel,
+    # then the listener is started again for the next records
+    listener.stop()
+    listener.start()
+
+
+def assert_handlers_not_copied(handlers: dict[str, Any], expected_handlers: dict[str, Any]) -> None:
+    # without overridden formatters default handler configs are passed to dictConfig as is, without copying
+    for handler_name, handler_config in expected_handlers.items():
+        assert handlers[handler_name] is handler_config
 
 
-def capture_json_log(capsys: CaptureFixture[str], queue: Any) -> dict[str, Any]:
-    wait_log_queue(queue)
-    log_output = (
-        capsys.readouterr().out.strip()
-    )  # we log to stdout by default instead of stderr (even with picologging)
-    return cast('dict[str, Any]', json.loads(log_output))
+def capture_json_log(capfd: CaptureFixture[str], listener: Any) -> dict[str, Any]:
+    wait_log_queue(listener)
+    log_output = capfd.readouterr().out.strip()  # we log to stdout by default instead of stderr (even with picologging)
+    return cast('dict[str, Any]', orjson.loads(log_output))
 
 
-def assert_log(capsys: CaptureFixture[str], queue: Any, expected: str, count: int | None = None) -> None:
-    wait_log_queue(queue)
-    log_output = capsys.readouterr().out.strip()  # we log to stdout by default instead of stderr
+def assert_log(capfd: CaptureFixture[str], listener: Any, expected: str, count: int | None = None) -> None:
+    wait_log_queue(listener)
+    log_output = capfd.readouterr().out.strip()  # we log to stdout by default instead of stderr
     if count is not None:
         assert len(log_output.split('\n')) == count
     assert log_output == expected
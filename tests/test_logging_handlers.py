@@ -0,0 +1,296 @@
+import io
+import json
+import logging
+import multiprocessing
+import sys
+import threading
+from queue import Queue, SimpleQueue
+from typing import Any, cast
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from modern_pylogging.contextvars_helpers import update_log_extra
+from modern_pylogging.json_formatter import JsonFormatterLogging
+from modern_pylogging.logging_handlers import (
+    BatchingStreamHandler,
+    BytesStreamHandler,
+    DroppingQueueHandler,
+    LoggingQueueListener,
+    QueueHandlerContextVarsHappyPy312,
+    QueueListenerHandler,
+    _active_listeners,
+)
+
+
+class CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes_count = 0
+
+    def write(self, text: str) -> int:
+        self.writes_count += 1
+        return super().write(text)
+
+
+class BlockingPutsQueue(Queue[logging.LogRecord]):
+    """Small queue which collects records put with blocking instead of waiting."""
+
+    def __init__(self) -> None:
+        super().__init__(maxsize=2)
+        self.blocking_puts: list[logging.LogRecord] = []
+        # lock which must not be held while waiting (it's checked from another thread)
+        self.lock_to_check: Any = None
+        self.lock_was_free: list[bool] = []
+
+    def put(self, item: logging.LogRecord, block: bool = True, timeout: Any = None) -> None:  # noqa: FBT001, FBT002, WPS110
+        if block:
+            self.blocking_puts.append(item)
+            if self.lock_to_check is not None:
+                self.lock_was_free.append(is_free_for_other_threads(self.lock_to_check))
+            return
+        super().put(item, block=block, timeout=timeout)
+
+
+def try_lock(lock: Any, acquired: list[bool]) -> None:
+    if lock.acquire(blocking=False):
+        lock.release()
+        acquired.append(True)
+
+
+def is_free_for_other_threads(lock: Any) -> bool:
+    acquired: list[bool] = []
+    thread = threading.Thread(target=try_lock, args=(lock, acquired))
+    thread.start()
+    thread.join()
+    return bool(acquired)
+
+
+def make_record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord('name', level, 'path', lineno=1, msg=msg, args=(), exc_info=None)
+
+
+def test_listener_handles_records_in_batches() -> None:
+    batching_stream = CountingStream()
+    batching_handler = BatchingStreamHandler(batching_stream)
+    batching_handler.setFormatter(logging.Formatter('%(message)s'))
+    # handlers without `handle_batch` get records one by one
+    warning_stream = io.StringIO()
+    warning_handler = logging.StreamHandler(warning_stream)
+    warning_handler.setLevel(logging.WARNING)
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    for record in (make_record('first'), make_record('second', logging.WARNING), make_record('third')):
+        queue.put_nowait(record)
+
+    listener = LoggingQueueListener(queue, batching_handler, warning_handler, respect_handler_level=True)
+    # started listeners are stopped at exit
+    assert listener in _active_listeners
+    was_running = listener.is_running
+    listener.stop()
+    assert was_running
+    assert listener not in _active_listeners
+    assert not listener.is_running
+    listener.stop()  # stopping twice does nothing
+
+    assert batching_stream.getvalue() == 'first\nsecond\nthird\n'
+    assert batching_stream.writes_count == 1
+    assert warning_stream.getvalue() == 'second\n'
+
+
+class OverReportingQueue(Queue[logging.LogRecord]):
+    """Queue which `qsize()` is only an estimate (as `multiprocessing.Queue` has)."""
+
+    def qsize(self) -> int:
+        return super().qsize() + 10
+
+
+class NoQsizeQueue(Queue[logging.LogRecord]):
+    """Queue without `qsize()` (as `multiprocessing.Queue` on macOS)."""
+
+    def qsize(self) -> int:
+        raise NotImplementedError
+
+
+@pytest.mark.parametrize('queue_class', [OverReportingQueue, NoQsizeQueue])
+def test_listener_with_approximate_qsize(queue_class: type[Queue[logging.LogRecord]]) -> None:
+    stream = io.StringIO()
+    handler = BatchingStreamHandler(stream)
+    queue = queue_class()
+    for msg in ('first', 'second'):
+        queue.put_nowait(make_record(msg))
+
+    listener = LoggingQueueListener(queue, handler)
+    queue.put_nowait(make_record('third'))
+    listener.stop()
+
+    assert stream.getvalue() == 'first\nsecond\nthird\n'
+
+
+def test_batching_stream_handler_applies_filters() -> None:
+    stream = io.StringIO()
+    handler = BatchingStreamHandler(stream)
+    handler.addFilter(lambda record: record.msg != 'skip')
+
+    handler.handle_batch([make_record('first'), make_record('skip'), make_record('second')])
+    handler.handle_batch([make_record('skip')])
+
+    assert stream.getvalue() == 'first\nsecond\n'
+
+
+@pytest.mark.parametrize('json_module', ['json', 'orjson'])
+def test_bytes_stream_handler(json_module: str) -> None:
+    stream = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+    handler = BytesStreamHandler(stream)
+    record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg='Привет %s', args=('1',), exc_info=None)
+
+    handler.setFormatter(JsonFormatterLogging(json_dumps_module=json_module))  # type:ignore[arg-type]
+    handler.emit(record)
+    # formatter without `format_bytes` falls back to the text stream
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    handler.emit(record)
+
+    first_line, second_line = stream.buffer.getvalue().decode().splitlines()
+    assert json.loads(first_line)['message'] == 'Привет 1'
+    assert second_line == 'Привет 1'
+
+
+def test_bytes_stream_handler_batch() -> None:
+    stream = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+    handler = BytesStreamHandler(stream)
+    handler.setFormatter(JsonFormatterLogging(json_dumps_module='orjson'))
+
+    handler.handle_batch([make_record('Привет'), make_record('second')])
+
+    lines = stream.buffer.getvalue().decode().splitlines()
+    assert [json.loads(line)['message'] for line in lines] == ['Привет', 'second']
+
+
+async def test_queue_handler_prepare_keeps_exc_info() -> None:  # noqa: RUF029
+    update_log_extra({'request_id': 1})
+    handler = QueueHandlerContextVarsHappyPy312(SimpleQueue())
+    exc_info = (ValueError, ValueError('bad value'), None)
+    mutable_arg = ['1']
+    record = logging.LogRecord(
+        'name', logging.ERROR, 'path', lineno=1, msg='Error %s', args=(mutable_arg,), exc_info=exc_info
+    )
+
+    prepared_record = handler.prepare(record)
+
+    assert prepared_record.msg == "Error ['1']"
+    assert prepared_record.args is None
+    assert prepared_record.exc_info == exc_info
+    assert prepared_record.binded_ctx_extra == {'request_id': 1}  # type:ignore[attr-defined]
+    # the original record is not changed
+    assert record.args == (mutable_arg,)
+    assert not hasattr(record, 'binded_ctx_extra')
+
+
+def test_queue_handler_prepare_immutable_args() -> None:
+    handler = QueueHandlerContextVarsHappyPy312(SimpleQueue())
+    record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg='%s %d', args=('1', 2), exc_info=None)
+
+    prepared_record = handler.prepare(record)
+
+    # immutable args are merged into the message by the listener's handlers
+    assert prepared_record.msg == '%s %d'
+    assert prepared_record.getMessage() == '1 2'
+
+    # a message which is not a str could be changed after the logging call
+    state = {'n': 1}
+    record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg=state, args=(), exc_info=None)
+    prepared_record = handler.prepare(record)
+    state['n'] = 2
+    assert prepared_record.msg == "{'n': 1}"
+
+
+def test_queue_handler_prepare_with_formatter() -> None:
+    handler = QueueHandlerContextVarsHappyPy312(SimpleQueue())
+    handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    record = logging.LogRecord('name', logging.INFO, 'path', lineno=1, msg='%s', args=('1',), exc_info=None)
+
+    prepared_record = handler.prepare(record)
+
+    # the handler's own formatter is used as with `QueueHandler.prepare`
+    assert prepared_record.msg == 'INFO: 1'
+    assert prepared_record.args is None
+    assert prepared_record.binded_ctx_extra == {}  # type:ignore[attr-defined]
+
+
+def test_queue_handler_prepare_other_process() -> None:
+    queue: multiprocessing.Queue[logging.LogRecord] = multiprocessing.Queue()
+    handler = QueueHandlerContextVarsHappyPy312(queue)  # type:ignore[arg-type]
+    exc_info: Any = None
+    try:
+        int('bad value')
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord('name', logging.ERROR, 'path', lineno=1, msg='Error', args=(), exc_info=exc_info)
+
+    # tracebacks can't be pickled, so they become a part of the message
+    queue.put(handler.prepare(record))
+    received_record = queue.get(timeout=5)
+    queue.close()
+
+    assert received_record.exc_info is None
+    assert 'ValueError' in received_record.msg
+
+
+def test_default_handler_is_not_shared(capsys: CaptureFixture[str]) -> None:
+    first_handler = QueueListenerHandler()
+    second_handler = QueueListenerHandler()
+    first_handler.listener.stop()
+    second_handler.listener.stop()
+    default_handler = first_handler.listener.handlers[0]
+
+    # settings of one queue handler don't leak into another one
+    assert default_handler is not second_handler.listener.handlers[0]
+    # stdout is taken at the moment of writing (so pytest can capture it)
+    default_handler.handle(make_record('Default'))
+    assert capsys.readouterr().out == 'Default\n'
+
+    stream = io.StringIO()
+    assert cast('logging.StreamHandler[Any]', default_handler).setStream(stream) is sys.stdout
+    default_handler.handle(make_record('Own stream'))
+    assert stream.getvalue() == 'Own stream\n'
+
+
+def test_dropping_queue_handler() -> None:
+    queue = BlockingPutsQueue()
+    handler = DroppingQueueHandler(queue)
+    handler.drop_warning_every = 2
+    queue.lock_to_check = handler.lock
+
+    for msg in ('first', 'second', 'dropped', 'dropped again'):
+        handler.handle(make_record(msg))
+    handler.handle(make_record('error is not dropped', logging.ERROR))
+
+    assert handler.dropped_count == 2
+    assert [error.msg for error in queue.blocking_puts] == ['error is not dropped']
+    # other threads are not blocked while the error waits for a place in the queue
+    assert queue.lock_was_free == [True]
+    assert [queue.get_nowait().msg for _ in range(2)] == ['first', 'second']
+    # there was no place for the warning, so it's sent after the next record
+    handler.handle(make_record('next'))
+    assert queue.get_nowait().msg == 'next'
+    assert queue.get_nowait().getMessage() == 'Logging queue is full, 2 records have been dropped so far'
+
+
+def test_dropping_queue_handler_stopped_listener() -> None:
+    handler = QueueListenerHandler(max_queue_size=1)
+    handler.listener.stop()
+
+    # nobody reads the queue, errors are dropped instead of waiting forever
+    for msg in ('queued', 'error', 'error again'):
+        handler.handle(make_record(msg, logging.ERROR))
+
+    assert handler.dropped_count == 2
+
+
+def test_dropping_queue_handler_error_put_timeout() -> None:
+    handler = DroppingQueueHandler(Queue(maxsize=1))
+    handler.error_put_timeout = 0.01
+
+    for msg in ('queued', 'error'):
+        handler.handle(make_record(msg, logging.ERROR))
+
+    assert handler.dropped_count == 1